@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
+import functools
+import hmac
+import queue
+import signal
+import socket
+import struct
 import sys
+import threading
 import time
 import dbus
 import dbus.exceptions
 import dbus.mainloop.glib
 import dbus.service
-from gi.repository import GLib
-import RPi.GPIO as GPIO
+from gi.repository import Gio, GLib
+import lgpio
 from datetime import datetime
 import logging
 
@@ -26,14 +33,11 @@ logging.getLogger('').addHandler(console)
 
 logger = logging.getLogger(__name__)
 
-# Disable GPIO warnings
-GPIO.setwarnings(False)
-
-# GPIO Setup
+# GPIO Setup (lgpio talks to /dev/gpiochip directly - leaner than
+# RPi.GPIO and supported on the Pi 5)
 RELAY_PIN = 18
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(RELAY_PIN, GPIO.OUT)
-GPIO.output(RELAY_PIN, GPIO.LOW)
+_gpio_chip = lgpio.gpiochip_open(0)
+lgpio.gpio_claim_output(_gpio_chip, RELAY_PIN, 0)
 logger.info("GPIO initialized - Relay on pin %d", RELAY_PIN)
 
 # LCD Setup (16x2)
@@ -57,6 +61,14 @@ SERVICE_UUID = "4fafc201-1fb5-459e-8fcc-c5c9c331914b"
 OTP_CHAR_UUID = "beb5483e-36e1-4688-b7f5-ea07361b26a8"
 STATUS_CHAR_UUID = "beb5483e-36e1-4688-b7f5-ea07361b26a9"
 
+# Immutable dbus-typed constants, wrapped once at module load instead of
+# on every D-Bus call that references them
+SERVICE_UUID_DBUS = dbus.String(SERVICE_UUID)
+OTP_CHAR_UUID_DBUS = dbus.String(OTP_CHAR_UUID)
+STATUS_CHAR_UUID_DBUS = dbus.String(STATUS_CHAR_UUID)
+LOCAL_NAME_DBUS = dbus.String('GuardianSafe')
+TX_POWER_INCLUDES = dbus.Array(['tx-power'], signature='s')
+
 # DBus paths
 BLUEZ_SERVICE_NAME = 'org.bluez'
 GATT_MANAGER_IFACE = 'org.bluez.GattManager1'
@@ -71,33 +83,111 @@ LE_ADVERTISEMENT_IFACE = 'org.bluez.LEAdvertisement1'
 otp_verified = False
 lock_open = False
 current_otp = None
+expected_otp = None  # Provisioned unlock code; None falls back to format-only checking
 status_characteristic = None  # Will hold reference to status characteristic for updates
 
+# Rejected-attempt bookkeeping (logged rate-limited, never per attempt)
+_rejected_otp_count = 0
+_last_reject_log = 0.0
+
 # System status
 safe_status = 1  # 0=inactive, 1=active, 2=maintenance, 3=offline
 battery_percent = 100  # Default to full
 voltage = 12.0  # Default voltage
 
+# Snapshot system uptime once so health ticks can derive it from the
+# monotonic clock instead of re-reading /proc/uptime every minute
+try:
+    with open('/proc/uptime', 'r') as f:
+        _initial_uptime = float(f.readline().split()[0])
+except Exception:
+    _initial_uptime = 0.0
+_start_mono = time.monotonic()
+
+# Precompiled so cache misses skip re-parsing the format string
+_STATUS_STRUCT = struct.Struct('>BBBBH')
+
+@functools.lru_cache(maxsize=32)
+def _pack_status_bytes(verified, lock, battery, status, voltage_int):
+    """Pack status scalars into a cached raw 6-byte payload.
+
+    Byte layout:
+    [0] verified (0/1)
+    [1] lock_open (0/1)
+    [2] battery_percent (0-100)
+    [3] safe_status (0=inactive, 1=active, 2=maintenance, 3=offline)
+    [4] voltage high byte
+    [5] voltage low byte
+    """
+    return _STATUS_STRUCT.pack(verified, lock, battery, status, voltage_int)
+
+@functools.lru_cache(maxsize=32)
+def _pack_status(verified, lock, battery, status, voltage_int):
+    """Cached dbus.Array wrapper around the packed status payload.
+
+    Status only changes when one of the five scalars changes, so the
+    packed payload is memoized to avoid rebuilding dbus wrappers on
+    every read/notify.
+    """
+    payload = _pack_status_bytes(verified, lock, battery, status, voltage_int)
+    return dbus.Array(payload, signature='y')
+
+def _current_status_key():
+    """Current status scalars as the tuple key used by _pack_status"""
+    return (
+        1 if otp_verified else 0,
+        1 if lock_open else 0,
+        max(0, min(100, int(battery_percent))),
+        safe_status,
+        int(voltage * 10) & 0xFFFF
+    )
+
+# LCD writes are nibble-clocked over I2C and can stall for 10-30 ms, so
+# they run on a dedicated daemon thread fed by a small bounded queue.
+# When the queue is full stale frames are dropped - only the latest
+# state matters on a 16x2 display.
+_lcd_queue = queue.Queue(maxsize=4)
+
+def _lcd_worker():
+    """Drain queued LCD frames off the main loop thread"""
+    last_frame = None
+    while True:
+        line1, line2 = _lcd_queue.get()
+        # Compose the full 32-char frame once; space padding overwrites
+        # leftovers so the >=1.5 ms clear() cycle is never needed
+        frame = f"{line1[:16]:<16}{line2[:16]:<16}"
+        if frame == last_frame:
+            continue
+        last_frame = frame
+        try:
+            lcd.home()
+            lcd.write_string(frame)
+        except Exception as e:
+            logger.error("LCD display error: %s", str(e))
+
+if lcd:
+    threading.Thread(target=_lcd_worker, daemon=True, name='lcd-worker').start()
+
 def display_message(line1, line2=""):
     """Display message on LCD"""
     if lcd:
         try:
-            lcd.clear()
-            lcd.write_string(line1[:16])
-            if line2:
-                lcd.cursor_pos = (1, 0)
-                lcd.write_string(line2[:16])
-        except Exception as e:
-            logger.error("LCD display error: %s", str(e))
-    logger.info("LCD: %s | %s", line1, line2)
+            _lcd_queue.put_nowait((line1, line2))
+        except queue.Full:
+            pass  # Drop the frame - a newer one is already queued
+    logger.debug("LCD: %s | %s", line1, line2)
 
 def open_lock():
     """Open the relay lock"""
-    global lock_open, status_characteristic
     logger.info("Opening lock - relay activating")
     display_message("Opening Lock...", "Stand By")
-    GPIO.output(RELAY_PIN, GPIO.HIGH)
-    time.sleep(2)  # Initial delay
+    lgpio.gpio_write(_gpio_chip, RELAY_PIN, 1)
+    # Let the relay settle without blocking the main loop
+    GLib.timeout_add(2000, _open_lock_finish)
+
+def _open_lock_finish():
+    """Complete the lock opening after the relay settle delay"""
+    global lock_open
     lock_open = True
     display_message("Lock Opened!", "Remove Items")
     logger.info("Lock opened successfully")
@@ -108,6 +198,7 @@ def open_lock():
 
     # Schedule automatic close after 15 seconds
     GLib.timeout_add_seconds(15, auto_close_lock)
+    return False  # One-shot timer
 
 def auto_close_lock():
     """Automatically close the lock after timeout"""
@@ -125,7 +216,7 @@ def close_lock():
     """Close the relay lock"""
     global lock_open, status_characteristic
     logger.info("Closing lock - relay deactivating")
-    GPIO.output(RELAY_PIN, GPIO.LOW)
+    lgpio.gpio_write(_gpio_chip, RELAY_PIN, 0)
     lock_open = False
     display_message("Lock Closed", "Ready")
     logger.info("Lock closed successfully")
@@ -134,40 +225,55 @@ def close_lock():
     if status_characteristic:
         status_characteristic.update_status()
 
+def _on_vcgencmd_done(proc, result):
+    """Parse the async vcgencmd output and update the voltage reading"""
+    global voltage
+
+    try:
+        _, stdout, _ = proc.communicate_utf8_finish(result)
+        if proc.get_successful():
+            # Output format: "volt=1.2000V"
+            volt_str = stdout.strip().split('=')[1].rstrip('V')
+            core_voltage = float(volt_str)
+            # Scale to typical 12V supply (this is just for display)
+            voltage = core_voltage * 10
+        else:
+            voltage = 12.0  # Default
+    except Exception:
+        voltage = 12.0  # Fallback
+
+    # Push the new reading through the delta gate - no signal goes out
+    # unless a status byte actually changed
+    if status_characteristic:
+        status_characteristic.update_status()
+
 def update_system_health():
     """Update battery and voltage readings"""
     global battery_percent, voltage, safe_status
 
     try:
-        # Read system uptime to simulate battery drain (for demo purposes)
+        # Derive system uptime from the cached boot snapshot to simulate
+        # battery drain (for demo purposes)
         # In production, you'd read from actual battery monitor hardware
-        with open('/proc/uptime', 'r') as f:
-            uptime_seconds = float(f.readline().split()[0])
+        uptime_seconds = _initial_uptime + (time.monotonic() - _start_mono)
 
         # Simulate battery drain: 1% per hour of uptime (max 100%)
-        drain = min(int(uptime_seconds / 3600), 100)
+        drain = min(int(uptime_seconds) // 3600, 100)
         battery_percent = max(0, 100 - drain)
 
-        # Try to read CPU voltage as a proxy (requires vcgencmd)
+        # Try to read CPU voltage as a proxy (requires vcgencmd);
+        # run asynchronously so the fork+exec+wait never stalls the loop
         try:
-            import subprocess
-            result = subprocess.run(['vcgencmd', 'measure_volts', 'core'],
-                                  capture_output=True, text=True, timeout=2)
-            if result.returncode == 0:
-                # Output format: "volt=1.2000V"
-                volt_str = result.stdout.strip().split('=')[1].rstrip('V')
-                core_voltage = float(volt_str)
-                # Scale to typical 12V supply (this is just for display)
-                voltage = core_voltage * 10
-            else:
-                voltage = 12.0  # Default
-        except:
-            voltage = 12.0  # Fallback
+            proc = Gio.Subprocess.new(['vcgencmd', 'measure_volts', 'core'],
+                                      Gio.SubprocessFlags.STDOUT_PIPE)
+            proc.communicate_utf8_async(None, None, _on_vcgencmd_done)
+        except Exception:
+            voltage = 12.0  # Fallback (vcgencmd unavailable)
 
         # System is active if lock operations are working
         safe_status = 1  # active
 
-        logger.debug("System health updated - Battery: %d%%, Voltage: %.2fV, Status: %d", 
+        logger.debug("System health updated - Battery: %d%%, Voltage: %.2fV, Status: %d",
                     battery_percent, voltage, safe_status)
 
     except Exception as e:
@@ -176,33 +282,67 @@ def update_system_health():
         voltage = 12.0
         safe_status = 1
 
+    # Let connected phones see battery drift, but only when a status
+    # byte actually changed - the notify path drops unchanged payloads
+    if status_characteristic:
+        status_characteristic.update_status()
+
     return True  # Continue periodic updates
 
+def _delayed_open():
+    """One-shot timer callback opening the lock after OTP verification"""
+    open_lock()
+    return False
+
+def set_expected_otp(otp):
+    """Provision the OTP code the safe will accept for the next unlock"""
+    global expected_otp
+    expected_otp = otp
+
+def _note_rejected_otp():
+    """Count a rejected attempt, logging at most once per 30 seconds"""
+    global _rejected_otp_count, _last_reject_log
+    _rejected_otp_count += 1
+    now = time.monotonic()
+    if now - _last_reject_log >= 30:
+        _last_reject_log = now
+        logger.warning("OTP verification failed - %d rejected attempt(s)",
+                       _rejected_otp_count)
+        _rejected_otp_count = 0
+
 def verify_otp(received_otp):
     """Verify OTP code"""
-    global otp_verified, current_otp, status_characteristic
+    global otp_verified, current_otp
 
-    logger.info("OTP verification attempt - Code: %s", received_otp)
-    display_message("Verifying OTP", received_otp)
+    # Fast reject with no log/LCD I/O - invalid attempts can be spammed
+    # over BLE and each write/display costs real time on the loop
+    if not (len(received_otp) == 6 and received_otp.isdigit()):
+        _note_rejected_otp()
+        return False
 
-    # Verify OTP format (6 digits)
-    if len(received_otp) == 6 and received_otp.isdigit():
-        current_otp = received_otp
-        otp_verified = True
-        logger.info("OTP verified successfully - Code: %s", received_otp)
-        display_message("OTP Verified!", "Opening...")
+    # Constant-time comparison against the provisioned code so timing
+    # doesn't leak how much of the guess matched
+    if expected_otp is None:
+        # Fail-open legacy mode: any well-formed code is accepted.
+        # Keep this loud until a provisioning call wires set_expected_otp
+        logger.warning("No OTP provisioned - accepting code on format check alone")
+    elif not hmac.compare_digest(received_otp, expected_otp):
+        _note_rejected_otp()
+        return False
 
-        # Notify status change
-        if status_characteristic:
-            status_characteristic.update_status()
+    current_otp = received_otp
+    otp_verified = True
+    logger.info("OTP verified successfully - Code: %s", received_otp)
+    display_message("OTP Verified!", "Opening...")
 
-        time.sleep(1)
-        open_lock()
-        return True
-    else:
-        logger.warning("OTP verification failed - Invalid format: %s", received_otp)
-        display_message("Invalid OTP", "Try Again")
-        return False
+    # Notify status change
+    if status_characteristic:
+        status_characteristic.update_status()
+
+    # Give the user a moment to read the display, then open without
+    # blocking the main loop
+    GLib.timeout_add(1000, _delayed_open)
+    return True
 
 class Application(dbus.service.Object):
     """DBus application for BLE GATT server"""
@@ -210,6 +350,10 @@ class Application(dbus.service.Object):
     def __init__(self, bus):
         self.path = '/'
         self.services = []
+        # Flat {path: properties} map kept current as services and
+        # characteristics are added, so GetManagedObjects is a plain
+        # dict return instead of a nested rebuild per BlueZ query
+        self._managed = {}
         dbus.service.Object.__init__(self, bus, self.path)
         logger.debug("Application initialized")
 
@@ -218,17 +362,20 @@ class Application(dbus.service.Object):
 
     def add_service(self, service):
         self.services.append(service)
+        service._application = self
+        self._managed[service.get_path()] = service.get_properties()
+        for chrc in service.get_characteristics():
+            self._managed[chrc.get_path()] = chrc.get_properties()
         logger.debug("Service added to application")
 
+    def _on_characteristic_added(self, service, characteristic):
+        """Refresh the managed map when a service gains a characteristic"""
+        self._managed[service.get_path()] = service.get_properties()
+        self._managed[characteristic.get_path()] = characteristic.get_properties()
+
     @dbus.service.method(DBUS_OM_IFACE, out_signature='a{oa{sa{sv}}}')
     def GetManagedObjects(self):
-        response = {}
-        for service in self.services:
-            response[service.get_path()] = service.get_properties()
-            chrcs = service.get_characteristics()
-            for chrc in chrcs:
-                response[chrc.get_path()] = chrc.get_properties()
-        return response
+        return self._managed
 
 class Service(dbus.service.Object):
     """BLE GATT Service"""
@@ -241,11 +388,16 @@ class Service(dbus.service.Object):
         self.uuid = uuid
         self.primary = primary
         self.characteristics = []
+        self._application = None
+        self._object_path = dbus.ObjectPath(self.path)
+        self._properties = None
+        self._rebuild_properties()
         dbus.service.Object.__init__(self, bus, self.path)
         logger.debug("Service created - UUID: %s", uuid)
 
-    def get_properties(self):
-        return {
+    def _rebuild_properties(self):
+        """Rebuild the cached properties dict (on characteristic changes)"""
+        self._properties = {
             GATT_SERVICE_IFACE: {
                 'UUID': self.uuid,
                 'Primary': self.primary,
@@ -255,11 +407,17 @@ class Service(dbus.service.Object):
             }
         }
 
+    def get_properties(self):
+        return self._properties
+
     def get_path(self):
-        return dbus.ObjectPath(self.path)
+        return self._object_path
 
     def add_characteristic(self, characteristic):
         self.characteristics.append(characteristic)
+        self._rebuild_properties()
+        if self._application is not None:
+            self._application._on_characteristic_added(self, characteristic)
         logger.debug("Characteristic added to service")
 
     def get_characteristic_paths(self):
@@ -282,11 +440,8 @@ class Characteristic(dbus.service.Object):
         self.flags = flags
         # Initialize with proper signature - empty byte array
         self.value = dbus.Array([], signature='y')
-        dbus.service.Object.__init__(self, bus, self.path)
-        logger.debug("Characteristic created - UUID: %s, Flags: %s", uuid, flags)
-
-    def get_properties(self):
-        return {
+        self._object_path = dbus.ObjectPath(self.path)
+        self._properties = {
             GATT_CHRC_IFACE: {
                 'Service': self.service.get_path(),
                 'UUID': self.uuid,
@@ -294,9 +449,17 @@ class Characteristic(dbus.service.Object):
                 'Value': self.value
             }
         }
+        dbus.service.Object.__init__(self, bus, self.path)
+        logger.debug("Characteristic created - UUID: %s, Flags: %s", uuid, flags)
+
+    def get_properties(self):
+        # Everything but Value is immutable after construction, so only
+        # the current value is refreshed in the cached dict
+        self._properties[GATT_CHRC_IFACE]['Value'] = self.value
+        return self._properties
 
     def get_path(self):
-        return dbus.ObjectPath(self.path)
+        return self._object_path
 
     @dbus.service.method(GATT_CHRC_IFACE,
                         in_signature='a{sv}',
@@ -316,22 +479,23 @@ class OTPCharacteristic(Characteristic):
     def __init__(self, bus, index, service):
         Characteristic.__init__(
             self, bus, index,
-            OTP_CHAR_UUID,
+            OTP_CHAR_UUID_DBUS,
             ['write', 'write-without-response'],
             service)
         logger.info("OTP Characteristic initialized")
 
     def WriteValue(self, value, options):
-        global otp_verified
-        logger.info("OTP WriteValue called - Received %d bytes", len(value))
-        
-        # Convert bytes to string
-        otp_code = ''.join([chr(byte) for byte in value])
-        logger.info("OTP received from mobile app: %s", otp_code)
-        
-        # Verify OTP
-        verify_otp(otp_code)
-        
+        # Decode in one C-level pass instead of per-byte chr() calls
+        otp_code = bytes(value).decode('ascii', errors='ignore').strip()
+
+        # Cheap format check up front so malformed writes skip the
+        # logging and verification cost entirely
+        if len(otp_code) == 6 and otp_code.isdigit():
+            logger.debug("OTP received from mobile app: %s", otp_code)
+            verify_otp(otp_code)
+        else:
+            logger.debug("Malformed OTP write ignored - %d bytes", len(value))
+
         self.value = value
 
 class StatusCharacteristic(Characteristic):
@@ -340,75 +504,102 @@ class StatusCharacteristic(Characteristic):
     def __init__(self, bus, index, service):
         Characteristic.__init__(
             self, bus, index,
-            STATUS_CHAR_UUID,
+            STATUS_CHAR_UUID_DBUS,
             ['read', 'notify'],
             service)
         # Initialize with default status [0, 0, 100, 1, 0, 120] (6 bytes)
-        self.value = dbus.Array([dbus.Byte(0), dbus.Byte(0), dbus.Byte(100), dbus.Byte(1), dbus.Byte(0), dbus.Byte(120)], signature='y')
+        self.value = _pack_status(0, 0, 100, 1, 120)
+        self._last_notified_key = None
+        self._notify_pending = False
+        self._notify_sock = None
+        self._notify_mtu = 0
+        # BlueZ only calls AcquireNotify on characteristics that publish
+        # NotifyAcquired (its presence advertises fd support server-side)
+        self._properties[GATT_CHRC_IFACE]['NotifyAcquired'] = dbus.Boolean(False)
         logger.info("Status Characteristic initialized")
 
+    @dbus.service.method(GATT_CHRC_IFACE, in_signature='a{sv}',
+                         out_signature='hq')
+    def AcquireNotify(self, options):
+        """Hand BlueZ a notification pipe so status updates bypass D-Bus.
+
+        Writes to the returned fd go straight over ACL without the
+        PropertiesChanged marshal/unmarshal round trip (BlueZ >= 5.46).
+        """
+        if self._notify_sock is not None:
+            self._notify_sock.close()
+
+        local, remote = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        # Non-blocking so a stalled peer can never wedge the main loop
+        # inside send()
+        local.setblocking(False)
+        self._notify_sock = local
+        self._notify_mtu = int(options.get('mtu', 23))
+        self._properties[GATT_CHRC_IFACE]['NotifyAcquired'] = dbus.Boolean(True)
+        fd = dbus.types.UnixFd(remote.fileno())
+        remote.close()
+
+        logger.info("Notify fd acquired - MTU: %d", self._notify_mtu)
+        return (fd, dbus.UInt16(self._notify_mtu))
+
     def ReadValue(self, options):
-        global otp_verified, lock_open, battery_percent, safe_status, voltage
-        logger.debug("Status ReadValue called")
-
-        # Pack status into 6 bytes:
-        # [0] verified (0/1)
-        # [1] lock_open (0/1)
-        # [2] battery_percent (0-100)
-        # [3] safe_status (0=inactive, 1=active, 2=maintenance, 3=offline)
-        # [4] voltage high byte
-        # [5] voltage low byte
-
-        verified_byte = 1 if otp_verified else 0
-        lock_byte = 1 if lock_open else 0
-        battery_byte = max(0, min(100, int(battery_percent)))
-        status_byte = safe_status
-
-        # Convert voltage to 2 bytes (multiply by 10 to preserve 1 decimal place)
-        voltage_int = int(voltage * 10)
-        voltage_high = (voltage_int >> 8) & 0xFF
-        voltage_low = voltage_int & 0xFF
-
-        status = dbus.Array([
-            dbus.Byte(verified_byte),
-            dbus.Byte(lock_byte),
-            dbus.Byte(battery_byte),
-            dbus.Byte(status_byte),
-            dbus.Byte(voltage_high),
-            dbus.Byte(voltage_low)
-        ], signature='y')
-
-        logger.info("Status sent - Verified: %s, Lock: %s, Battery: %d%%, Status: %d, Voltage: %.2fV",
-                   otp_verified, lock_open, battery_percent, safe_status, voltage)
-
-        self.value = status
+        status = _pack_status(*_current_status_key())
+
+        # Per-read logging stays at DEBUG - journald writes cost real
+        # time on every BLE op
+        logger.debug("Status sent - Verified: %s, Lock: %s, Battery: %d%%, Status: %d, Voltage: %.2fV",
+                     otp_verified, lock_open, battery_percent, safe_status, voltage)
+
+        # The packer memoizes, so an unchanged status returns the same
+        # object and the assignment can be skipped
+        if status is not self.value:
+            self.value = status
         return status
 
     def update_status(self):
-        """Update and notify status change"""
-        global otp_verified, lock_open, battery_percent, safe_status, voltage
-
-        verified_byte = 1 if otp_verified else 0
-        lock_byte = 1 if lock_open else 0
-        battery_byte = max(0, min(100, int(battery_percent)))
-        status_byte = safe_status
-
-        voltage_int = int(voltage * 10)
-        voltage_high = (voltage_int >> 8) & 0xFF
-        voltage_low = voltage_int & 0xFF
-
-        self.value = dbus.Array([
-            dbus.Byte(verified_byte),
-            dbus.Byte(lock_byte),
-            dbus.Byte(battery_byte),
-            dbus.Byte(status_byte),
-            dbus.Byte(voltage_high),
-            dbus.Byte(voltage_low)
-        ], signature='y')
+        """Schedule a status notification, coalescing rapid bursts"""
+        if self._notify_pending:
+            # A flush is already armed - it will pick up the final state
+            return
+        self._notify_pending = True
+        GLib.timeout_add(50, self._flush_notify)
+
+    def _flush_notify(self):
+        """Emit a single notification carrying the latest status"""
+        self._notify_pending = False
+
+        key = _current_status_key()
+        if key == self._last_notified_key:
+            # Nothing changed since the last notification - skip the signal
+            logger.debug("Status unchanged - notification skipped")
+            return False
+
+        self._last_notified_key = key
+        self.value = _pack_status(*key)
+
+        # Prefer the acquired notify fd - a raw write skips D-Bus
+        # marshalling entirely
+        if self._notify_sock is not None:
+            try:
+                self._notify_sock.send(_pack_status_bytes(*key))
+                logger.debug("Status notification written to notify fd")
+                return False
+            except BlockingIOError:
+                # Peer buffer full - drop this frame, keep the fd; the
+                # next status change carries the fresh state anyway
+                logger.debug("Notify fd busy - frame dropped")
+                return False
+            except OSError:
+                # Client hung up - drop the fd and fall back to signals
+                logger.info("Notify fd closed by peer - reverting to signals")
+                self._notify_sock.close()
+                self._notify_sock = None
+                self._properties[GATT_CHRC_IFACE]['NotifyAcquired'] = dbus.Boolean(False)
 
         # Emit property changed signal for notification
         self.PropertiesChanged(GATT_CHRC_IFACE, {'Value': self.value}, [])
         logger.debug("Status notification sent to mobile app")
+        return False  # One-shot timer
 
     @dbus.service.signal(DBUS_PROP_IFACE, signature='sa{sv}as')
     def PropertiesChanged(self, interface, changed, invalidated):
@@ -427,12 +618,15 @@ class Advertisement(dbus.service.Object):
         self.manufacturer_data = None
         self.solicit_uuids = None
         self.service_data = None
-        self.local_name = 'GuardianSafe'
+        self.local_name = LOCAL_NAME_DBUS
         self.include_tx_power = False
+        self._object_path = dbus.ObjectPath(self.path)
+        self._properties = None
         dbus.service.Object.__init__(self, bus, self.path)
         logger.debug("Advertisement created - Name: %s", self.local_name)
 
-    def get_properties(self):
+    def _freeze(self):
+        """Build the properties dict once after all setters have run"""
         properties = dict()
         properties['Type'] = self.ad_type
         if self.service_uuids is not None:
@@ -441,11 +635,16 @@ class Advertisement(dbus.service.Object):
         if self.local_name is not None:
             properties['LocalName'] = dbus.String(self.local_name)
         if self.include_tx_power:
-            properties['Includes'] = dbus.Array(['tx-power'], signature='s')
-        return {LE_ADVERTISEMENT_IFACE: properties}
+            properties['Includes'] = TX_POWER_INCLUDES
+        self._properties = {LE_ADVERTISEMENT_IFACE: properties}
+
+    def get_properties(self):
+        if self._properties is None:
+            self._freeze()
+        return self._properties
 
     def get_path(self):
-        return dbus.ObjectPath(self.path)
+        return self._object_path
 
     @dbus.service.method(DBUS_PROP_IFACE,
                          in_signature='s',
@@ -463,13 +662,55 @@ class Advertisement(dbus.service.Object):
     def Release(self):
         logger.info("Advertisement released")
 
-def find_adapter(bus):
-    """Find Bluetooth adapter"""
+# Local mirror of BlueZ's object tree, primed once via GetManagedObjects
+# and kept current through InterfacesAdded/InterfacesRemoved signals so
+# adapter lookups never repeat the expensive full-tree snapshot.
+_managed_objects = None
+
+def _interfaces_added(path, interfaces):
+    """Track objects added to BlueZ's tree"""
+    if _managed_objects is not None:
+        _managed_objects.setdefault(path, {}).update(interfaces)
+
+def _interfaces_removed(path, interfaces):
+    """Track objects removed from BlueZ's tree"""
+    if _managed_objects is None:
+        return
+    props = _managed_objects.get(path)
+    if props is None:
+        return
+    for iface in interfaces:
+        props.pop(iface, None)
+    if not props:
+        del _managed_objects[path]
+
+def _prime_managed_objects(bus):
+    """Populate the local BlueZ object cache exactly once"""
+    global _managed_objects
+
+    if _managed_objects is not None:
+        return
+
+    bus.add_signal_receiver(_interfaces_added,
+                            dbus_interface=DBUS_OM_IFACE,
+                            signal_name='InterfacesAdded',
+                            bus_name=BLUEZ_SERVICE_NAME)
+    bus.add_signal_receiver(_interfaces_removed,
+                            dbus_interface=DBUS_OM_IFACE,
+                            signal_name='InterfacesRemoved',
+                            bus_name=BLUEZ_SERVICE_NAME)
+
     remote_om = dbus.Interface(bus.get_object(BLUEZ_SERVICE_NAME, '/'),
                                DBUS_OM_IFACE)
-    objects = remote_om.GetManagedObjects()
+    _managed_objects = {path: dict(props)
+                        for path, props in remote_om.GetManagedObjects().items()}
+    logger.debug("BlueZ object cache primed - %d objects", len(_managed_objects))
 
-    for o, props in objects.items():
+def find_adapter(bus):
+    """Find Bluetooth adapter"""
+    _prime_managed_objects(bus)
+
+    for o, props in _managed_objects.items():
         if GATT_MANAGER_IFACE in props.keys():
             return o
 
@@ -502,7 +743,7 @@ def main():
     app = Application(bus)
 
     # Create service
-    service = Service(bus, 0, SERVICE_UUID, True)
+    service = Service(bus, 0, SERVICE_UUID_DBUS, True)
     app.add_service(service)
 
     # Add OTP characteristic
@@ -531,7 +772,8 @@ def main():
                                LE_ADVERTISING_MANAGER_IFACE)
     
     advertisement = Advertisement(bus, 0, 'peripheral')
-    advertisement.service_uuids = [SERVICE_UUID]
+    advertisement.service_uuids = [SERVICE_UUID_DBUS]
+    advertisement._freeze()
 
     logger.info("Registering BLE advertisement...")
     ad_manager.RegisterAdvertisement(advertisement.get_path(), {},
@@ -539,6 +781,9 @@ def main():
                                     error_handler=lambda e: logger.error("Failed to register advertisement: %s", str(e)))
 
     display_message("Guardian Safe", "Ready")
+    if expected_otp is None:
+        logger.warning("SECURITY: no unlock code provisioned - any 6-digit OTP "
+                       "will open the safe until set_expected_otp() is wired up")
     logger.info("BLE Server running - Waiting for mobile app connection")
     logger.info("Service UUID: %s", SERVICE_UUID)
     logger.info("Device Name: GuardianSafe")
@@ -548,30 +793,39 @@ def main():
     update_system_health()  # Initial update
 
     mainloop = GLib.MainLoop()
-    
+
+    # Handle shutdown signals on the loop itself instead of unwinding it
+    # with KeyboardInterrupt - systemd's SIGTERM now gets the same clean
+    # teardown as Ctrl-C
+    def _request_shutdown():
+        mainloop.quit()
+        return False
+
+    GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGINT, _request_shutdown)
+    GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGTERM, _request_shutdown)
+
+    mainloop.run()
+
+    logger.info("Shutdown signal received - Stopping server")
+    display_message("Shutting Down", "")
+
+    # Clean shutdown
     try:
-        mainloop.run()
-    except KeyboardInterrupt:
-        logger.info("Shutdown signal received - Stopping server")
-        display_message("Shutting Down", "")
-        
-        # Clean shutdown
-        try:
-            if ad_manager and advertisement:
-                ad_manager.UnregisterAdvertisement(advertisement.get_path())
-                logger.info("Advertisement unregistered")
-        except Exception as e:
-            logger.error("Error unregistering advertisement: %s", str(e))
-            
-        try:
-            if service_manager and app:
-                service_manager.UnregisterApplication(app.get_path())
-                logger.info("Application unregistered")
-        except Exception as e:
-            logger.error("Error unregistering application: %s", str(e))
-            
-        close_lock()
-        logger.info("Guardian Safe BLE Server stopped")
+        if ad_manager and advertisement:
+            ad_manager.UnregisterAdvertisement(advertisement.get_path())
+            logger.info("Advertisement unregistered")
+    except Exception as e:
+        logger.error("Error unregistering advertisement: %s", str(e))
+
+    try:
+        if service_manager and app:
+            service_manager.UnregisterApplication(app.get_path())
+            logger.info("Application unregistered")
+    except Exception as e:
+        logger.error("Error unregistering application: %s", str(e))
+
+    close_lock()
+    logger.info("Guardian Safe BLE Server stopped")
 
 if __name__ == '__main__':
     try:
@@ -581,7 +835,8 @@ if __name__ == '__main__':
     except Exception as e:
         logger.critical("Fatal error occurred: %s", str(e), exc_info=True)
     finally:
-        GPIO.cleanup()
+        lgpio.gpio_write(_gpio_chip, RELAY_PIN, 0)
+        lgpio.gpiochip_close(_gpio_chip)
         logger.info("GPIO cleanup completed")
         if lcd:
             lcd.clear()